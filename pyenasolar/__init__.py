@@ -1,28 +1,72 @@
 """PyEnaSolar communicates with EnaSolar inverters"""
 
 import asyncio
+from itertools import islice
 import re
 from datetime import date
 import logging
-import xml.etree.ElementTree as ET
 import aiohttp
+from yarl import URL
+
+try:
+    from lxml import etree as ET
+
+    # The inverter's XML carries no IDs, so skip building the ID table
+    _XML_PARSER = ET.XMLParser(collect_ids=False)
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    _XML_PARSER = None
 
 _LOGGER = logging.getLogger(__name__)
 
 URL_PATH_METERS = "meters.xml"
 URL_PATH_DATA = "data.xml"
+URL_PATH_VERSION = "wv.txt"
+URL_PATH_SETTINGS = "settings.html"
 
 HAS_POWER_METER = 1
 HAS_SOLAR_METER = 2
 HAS_TEMPERATURE = 4
 USE_FAHRENHIET = 256
 
+# Seconds allowed for a poll while the inverter is answering, and while
+# trying to reach it again after a failure
+TIMEOUT_HEALTHY = 5
+TIMEOUT_RECOVERY = 30
+
+# Seconds to wait before polling again after consecutive failures,
+# doubling per failure up to the maximum
+BACKOFF_BASE = 5
+BACKOFF_MAX = 300
+
+_SERIAL_RE = re.compile(
+    r'\(Number\(\("(\d+)"\)\*(\d+)\)\+Number\("(\d+)"\)\)', re.I
+)
+_CAP_RE = re.compile(r'Number\("(\d+|\d+\.\d+)"\);', re.I)
+
 
 class Sensor:
     """Sensor definition"""
 
     # pylint: disable=too-many-instance-attributes,too-few-public-methods
 
+    __slots__ = (
+        "key",
+        "is_hex",
+        "name",
+        "unit",
+        "factor",
+        "is_meter",
+        "per_day_basis",
+        "per_total_basis",
+        "convert",
+        "idx",
+        "_values",
+        "_dates",
+        "_enabled",
+    )
+
     def __init__(
         self,
         key,
@@ -40,19 +84,86 @@ class Sensor:
         self.name = name
         self.unit = unit
         self.factor = factor
-        self.value = None
         self.is_meter = is_meter
         self.per_day_basis = per_day_basis
         self.per_total_basis = per_total_basis
-        self.date = date.today()
-        self.enabled = True
+
+        # Value, date and enabled flag live at position idx of parallel
+        # lists, shared across all sensors once added to Sensors
+        self.idx = 0
+        self._values = [None]
+        self._dates = [date.today()]
+        self._enabled = [True]
+
+        # Build the raw text -> value conversion once, skipping the
+        # float round-trip and multiply where the factor is 1
+        if is_hex and factor == 1:
+            self.convert = lambda s: int(s, 16)
+        elif is_hex:
+            self.convert = lambda s, f=factor: int(s, 16) * f
+        elif factor == 1:
+            self.convert = float
+        else:
+            self.convert = lambda s, f=factor: float(s) * f
+
+    @property
+    def value(self):
+        """Latest value read from the inverter."""
+        return self._values[self.idx]
+
+    @value.setter
+    def value(self, value):
+        self._values[self.idx] = value
+
+    @property
+    def date(self):
+        """Date of the latest value."""
+        return self._dates[self.idx]
+
+    @date.setter
+    def date(self, value):
+        self._dates[self.idx] = value
+
+    @property
+    def enabled(self):
+        """Whether the sensor has been reported by the inverter."""
+        return self._enabled[self.idx]
+
+    @enabled.setter
+    def enabled(self, value):
+        self._enabled[self.idx] = value
+
+    def bind_state(self, values, dates, enabled, idx) -> None:
+        """Move value, date and enabled flag to idx of the given lists."""
+        if idx == len(values):
+            values.append(None)
+            dates.append(None)
+            enabled.append(False)
+        values[idx] = self.value
+        dates[idx] = self.date
+        enabled[idx] = self.enabled
+        self._values = values
+        self._dates = dates
+        self._enabled = enabled
+        self.idx = idx
 
 
 class Sensors:
     """EnaSolar sensors"""
 
+    # pylint: disable=too-many-instance-attributes
+
     def __init__(self, inv):
         self.__s = []
+        self.__by_name = {}
+        self.__by_key = {}
+        self.meter_sensors = []
+        self.data_sensors = []
+        self.by_key_meter = {}
+        self.by_key_data = {}
+        self.values = []
+        self.dates = []
+        self.enabled = []
         self.add(
             (
                 Sensor("OutputPower", False, "output_power",
@@ -70,11 +181,11 @@ class Sensors:
                 Sensor("DaysProducing", True, "days_producing",
                        1, False, "d", False, True),
                 Sensor("HoursExportedToday", False, "today_hours",
-                       0.0167, False, "h", True),
+                       1 / 60, False, "h", True),
                 Sensor("HoursExportedYesterday", False, "yesterday_hours",
-                       0.0167, False, "h", True),
+                       1 / 60, False, "h", True),
                 Sensor("HoursExportedLifetime", True, "total_hours",
-                       0.0167, False, "h", False, True),
+                       1 / 60, False, "h", False, True),
                 Sensor("Utilisation", False, "utilisation",
                        1, True, "%"),
                 Sensor("AverageDailyPower", False, "average_daily_power",
@@ -121,20 +232,15 @@ class Sensors:
         return len(self.__s)
 
     def __contains__(self, key: str) -> bool:
-        """Get a sensor using either the name or key."""
-        try:
-            if self[key]:
-                return True
-        except KeyError:
-            return False
-        return False
+        """Check for a sensor using either the name or key."""
+        return key in self.__by_name or key in self.__by_key
 
     def __getitem__(self, key: str) -> Sensor:
         """Get a sensor using either the name or key."""
-        for sen in self.__s:
-            if key in (sen.name, sen.key):
-                return sen
-        raise KeyError(key)
+        sen = self.__by_name.get(key)
+        if sen is None:
+            sen = self.__by_key[key]
+        return sen
 
     def __iter__(self):
         """Iterator."""
@@ -142,6 +248,7 @@ class Sensors:
 
     def add(self, sensor: Sensor) -> None:
         """Add a sensor, warning if it exists."""
+        # pylint: disable=too-many-branches
         if isinstance(sensor, (list, tuple)):
             for sss in sensor:
                 self.add(sss)
@@ -150,32 +257,117 @@ class Sensors:
         if not isinstance(sensor, Sensor):
             raise TypeError("pysenasolar.Sensor expected")
 
-        if sensor.name in self:
-            old = self[sensor.name]
-            self.__s.remove(old)
+        idx = len(self.__s)
+        if sensor.name in self.__by_name:
+            old = self.__by_name.pop(sensor.name)
+            if self.__by_key.get(old.key) is old:
+                del self.__by_key[old.key]
+            # The replacement takes over the old sensor's slot
+            idx = old.idx
+            old.bind_state([], [], [], 0)
+            if old.is_meter:
+                self.meter_sensors.remove(old)
+                if self.by_key_meter.get(old.key) is old:
+                    del self.by_key_meter[old.key]
+            else:
+                self.data_sensors.remove(old)
+                if self.by_key_data.get(old.key) is old:
+                    del self.by_key_data[old.key]
             _LOGGER.warning("Replacing sensor %s with %s", old, sensor)
 
-        if sensor.key in self:
+        if sensor.key in self.__by_key:
             _LOGGER.warning("Duplicate EnaSolar sensor key %s", sensor.key)
 
-        self.__s.append(sensor)
+        if idx == len(self.__s):
+            self.__s.append(sensor)
+        else:
+            self.__s[idx] = sensor
+        sensor.bind_state(self.values, self.dates, self.enabled, idx)
+        if sensor.is_meter:
+            self.meter_sensors.append(sensor)
+            self.by_key_meter.setdefault(sensor.key, sensor)
+        else:
+            self.data_sensors.append(sensor)
+            self.by_key_data.setdefault(sensor.key, sensor)
+        self.__by_name[sensor.name] = sensor
+        self.__by_key.setdefault(sensor.key, sensor)
 
 
 class EnaSolar:
     """Provides access to EnaSolar inverter data"""
 
-    def __init__(self):
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, max_concurrency=1):
         self.host = None
         self.url = None
+        self._base_url = None
+        self._meters_url = None
+        self._data_url = None
         self.serial_no = None
         self.capability = None
         self.dc_strings = None
         self.max_output = None
         self.sensors = None
+        self._session = None
+        # The inverter's embedded web server copes poorly with parallel
+        # requests, so bound how many may be in flight at once
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+        self._failure_count = 0
+        self._next_attempt_ts = 0.0
+        # Last body seen per page and the sensor indexes it updated
+        self._last_page = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                raise_for_status=True,
+                connector=aiohttp.TCPConnector(
+                    limit=4, limit_per_host=2, keepalive_timeout=60
+                ),
+            )
+        return self._session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the request semaphore, creating it in the running loop"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    async def close(self) -> None:
+        """Close the shared session and its pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _request_timeout(self) -> aiohttp.ClientTimeout:
+        """Short timeout while healthy, longer while recovering"""
+        if self._failure_count:
+            return aiohttp.ClientTimeout(total=TIMEOUT_RECOVERY)
+        return aiohttp.ClientTimeout(total=TIMEOUT_HEALTHY)
+
+    def _backing_off(self) -> bool:
+        """Whether polls are suspended after recent failures"""
+        return asyncio.get_running_loop().time() < self._next_attempt_ts
+
+    def _record_failure(self) -> None:
+        """Push the next poll back exponentially"""
+        self._failure_count += 1
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** self._failure_count)
+        self._next_attempt_ts = asyncio.get_running_loop().time() + delay
+        _LOGGER.debug("Inverter unreachable, backing off for %ss", delay)
+
+    def _record_success(self) -> None:
+        """Return to normal polling"""
+        self._failure_count = 0
 
     def setup_sensors(self) -> None:
         """Instantiate the various sensors"""
         self.sensors = Sensors(self)
+        self._last_page.clear()
 
     def get_serial_no(self) -> str:
         """Expose Serial No """
@@ -197,52 +389,51 @@ class EnaSolar:
         """Connect to the inverter and try to extract the configuration"""
         self.host = host
         self.url = "http://{0}/".format(self.host)
+        self._last_page.clear()
+        self._base_url = URL(self.url)
+        self._meters_url = self._base_url / URL_PATH_METERS
+        self._data_url = self._base_url / URL_PATH_DATA
 
         version_ok = {21, 25, 26}
 
         _LOGGER.debug("Attempt to determine the Inverter's Serial No.")
         try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(
-                timeout=timeout, raise_for_status=True
-            ) as session:
-                try:
-                    current_url = self.url + "wv.txt"
-                    async with session.get(current_url) as response:
+            session = await self._get_session()
+            try:
+                current_url = self._base_url / URL_PATH_VERSION
+                async with self._get_semaphore(), \
+                        session.get(current_url) as response:
+                    data = await response.text()
+                    webpage_version = int(data)
+
+                _LOGGER.debug("Webpage Version: %s", webpage_version)
+                if webpage_version in version_ok:
+                    current_url = self._base_url / URL_PATH_SETTINGS
+                    async with self._get_semaphore(), \
+                            session.get(current_url) as response:
                         data = await response.text()
-                        webpage_version = int(data)
-
-                    _LOGGER.debug("Webpage Version: %s", webpage_version)
-                    if webpage_version in version_ok:
-                        current_url = self.url + "settings.html"
-                        async with session.get(current_url) as response:
-                            data = await response.text()
-                            pat = re.compile(
-                                r'\(Number\(\("(\d+)"\)\*(\d+)\)\+Number\("(\d+)"\)\)',
-                                re.M | re.I,
-                            )
-                            snum = pat.findall(data)
-                            if snum:
-                                self.serial_no = int(snum[0][0]) * \
-                                                 int(snum[0][1]) + \
-                                                 int(snum[0][2])
-                                _LOGGER.debug("Found Serial No. %s",
-                                              self.serial_no)
-                            else:
-                                _LOGGER.debug("Unable to extract Serial No.")
-                    else:
-                        _LOGGER.debug("Unknown Webpage Version")
-                        self.serial_no = 999999
-
-                except aiohttp.client_exceptions.ClientConnectorError as err:
-                    # Connection to inverter not possible.
-                    _LOGGER.warning(
-                        "Connection failed. Check FQDN or IP address - %s",
-                        str(err)
-                    )
-                    raise
-                except asyncio.TimeoutError:
-                    raise
+                        snum = _SERIAL_RE.search(data)
+                        if snum:
+                            self.serial_no = int(snum.group(1)) * \
+                                             int(snum.group(2)) + \
+                                             int(snum.group(3))
+                            _LOGGER.debug("Found Serial No. %s",
+                                          self.serial_no)
+                        else:
+                            _LOGGER.debug("Unable to extract Serial No.")
+                else:
+                    _LOGGER.debug("Unknown Webpage Version")
+                    self.serial_no = 999999
+
+            except aiohttp.client_exceptions.ClientConnectorError as err:
+                # Connection to inverter not possible.
+                _LOGGER.warning(
+                    "Connection failed. Check FQDN or IP address - %s",
+                    str(err)
+                )
+                raise
+            except asyncio.TimeoutError:
+                raise
 
         except aiohttp.client_exceptions.ClientResponseError as err:
             # Connection to inverter succeeded but not expected result
@@ -251,52 +442,49 @@ class EnaSolar:
 
         _LOGGER.debug("Attempt to determine Inverter model setup and capabilities")
         try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(
-                timeout=timeout, raise_for_status=True
-            ) as session:
-                if webpage_version in {25, 26}:
-                    current_url = self.url
-                    try:
-                        async with session.get(current_url) as response:
-                            data = await response.text()
-                            pat = re.compile(r'Number\("(\d+|\d+\.\d+)"\);',
-                                             re.M | re.I)
-                            cap = pat.findall(data)
-                            if cap:
-                                try:
-                                    self.capability = int(cap[0])
-                                    self.dc_strings = int(cap[1])
-                                    self.max_output = float(cap[2])
-                                    _LOGGER.debug(
-                                        "Found: CAP=%s, DC=%s, Max=%s",
-                                        self.capability,
-                                        self.dc_strings,
-                                        self.max_output,
-                                    )
-                                except:
-                                    self.capability = 0
-                                    self.dc_strings = 1
-                                    self.max_output = 2.0
-                                    _LOGGER.debug(
-                                        "Failed to extract Inverter capabilities"
-                                    )
-                            else:
+            session = await self._get_session()
+            if webpage_version in {25, 26}:
+                current_url = self._base_url
+                try:
+                    async with self._get_semaphore(), \
+                            session.get(current_url) as response:
+                        data = await response.text()
+                        cap = [m.group(1) for m in
+                               islice(_CAP_RE.finditer(data), 3)]
+                        if cap:
+                            try:
+                                self.capability = int(cap[0])
+                                self.dc_strings = int(cap[1])
+                                self.max_output = float(cap[2])
                                 _LOGGER.debug(
-                                    "Unable to extract Inverter capabilities"
+                                    "Found: CAP=%s, DC=%s, Max=%s",
+                                    self.capability,
+                                    self.dc_strings,
+                                    self.max_output,
                                 )
-                    except aiohttp.client_exceptions.ClientResponseError as err:
-                        # Connection to inverter succeeded but not expected result
-                        _LOGGER.warning("Connection to inverter succeeded. %s",
-                                        str(err))
-                        raise
-                else:
-                    self.capability = 0
-                    self.dc_strings = 1
-                    self.max_output = 2.0
-                    _LOGGER.debug(
-                        "Inverter capabilities not available with this version"
-                    )
+                            except:
+                                self.capability = 0
+                                self.dc_strings = 1
+                                self.max_output = 2.0
+                                _LOGGER.debug(
+                                    "Failed to extract Inverter capabilities"
+                                )
+                        else:
+                            _LOGGER.debug(
+                                "Unable to extract Inverter capabilities"
+                            )
+                except aiohttp.client_exceptions.ClientResponseError as err:
+                    # Connection to inverter succeeded but not expected result
+                    _LOGGER.warning("Connection to inverter succeeded. %s",
+                                    str(err))
+                    raise
+            else:
+                self.capability = 0
+                self.dc_strings = 1
+                self.max_output = 2.0
+                _LOGGER.debug(
+                    "Inverter capabilities not available with this version"
+                )
 
         except aiohttp.ClientConnectorError as err:
             # Connection to inverter not possible.
@@ -318,59 +506,145 @@ class EnaSolar:
 
     async def read_meters(self) -> bool:
         """Extract the meters from their web page"""
+        return await self._poll(self._meters_url, True, self._calc_utilisation)
+
+    async def read_data(self) -> bool:
+        """Extract the data accummulators from their web page"""
+        return await self._poll(self._data_url, False, self._calc_avg_daily)
+
+    async def read_all(self) -> list:
+        """Read the meters and data pages concurrently
+
+        The derived sensors of each page depend only on that page, so the
+        two polls do not race. Both requests go through the instance's
+        semaphore, so with the default max_concurrency=1 they still run
+        one after the other; pass max_concurrency=2 to overlap them.
+
+        If either poll raises, the other is cancelled and awaited before
+        the exception propagates.
+        """
+        tasks = [
+            asyncio.ensure_future(self.read_meters()),
+            asyncio.ensure_future(self.read_data()),
+        ]
         try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(
-                timeout=timeout, raise_for_status=True
-            ) as session:
-                current_url = self.url + URL_PATH_METERS
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-                try:
-                    async with session.get(current_url) as response:
-                        data = await response.text()
-                        at_least_one_enabled = False
-
-                        xml = ET.fromstring(data)
-
-                        for sen in self.sensors:
-                            if not sen.is_meter:
-                                continue
-                            find = xml.find(sen.key)
-                            if find is not None:
-                                sen.value = find.text
-                                if sen.is_hex:
-                                    sen.value = int(sen.value, 16)
-                                sen.value = float(sen.value) * sen.factor
-                                sen.date = date.today()
-                                sen.enabled = True
-                                at_least_one_enabled = True
-
-                            if sen.enabled:
-                                _LOGGER.debug(
-                                    "Set METER sensor %s => %s",
-                                    sen.name, sen.value
-                                )
+    def _calc_utilisation(self, today) -> Sensor:
+        """Derive utilisation from output power and the rated maximum"""
+        sen1 = self.sensors["OutputPower"]
+        sen2 = self.sensors["Utilisation"]
+        sen2.value = round((float(sen1.value) * 100 /
+                            self.max_output), 2)
+        sen2.date = today
+        sen2.enabled = True
+        _LOGGER.debug("Set CALC sensor %s => %s",
+                      sen2.name, sen2.value)
+        return sen2
+
+    def _calc_avg_daily(self, today) -> Sensor:
+        """Derive average daily output from lifetime energy and days"""
+        sen1 = self.sensors["EnergyLifetime"]
+        sen2 = self.sensors["DaysProducing"]
+        sen3 = self.sensors["AverageDailyPower"]
+        sen3.value = round((float(sen1.value) / sen2.value), 2)
+        sen3.date = today
+        sen3.enabled = True
+        _LOGGER.debug("Set CALC sensor %s => %s",
+                      sen3.name, sen3.value)
+        return sen3
+
+    def _refresh_unchanged(self, url, data, today) -> bool:
+        """Refresh dates only, if the page matches the last one parsed"""
+        last = self._last_page.get(url)
+        if last is None or last[0] != data:
+            return False
+        dates = self.sensors.dates
+        for idx in last[1]:
+            dates[idx] = today
+        return True
+
+    def _parse_page(self, url, data, is_meter, today, derived_calc) -> None:
+        """Update a page's sensors from its XML, then the derived ones"""
+        if is_meter:
+            by_key = self.sensors.by_key_meter
+        else:
+            by_key = self.sensors.by_key_data
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        values = self.sensors.values
+        dates = self.sensors.dates
+        enabled = self.sensors.enabled
+        updated = []
+
+        for child in ET.fromstring(data, _XML_PARSER):
+            sen = by_key.get(child.tag)
+            if sen is None or child.text is None:
+                continue
+            idx = sen.idx
+            values[idx] = sen.convert(child.text)
+            dates[idx] = today
+            enabled[idx] = True
+            updated.append(idx)
+
+            if debug:
+                _LOGGER.debug(
+                    "Set %s sensor %s => %s",
+                    "METER" if is_meter else "DATA", sen.name, values[idx]
+                )
+
+        if not updated:
+            raise UnexpectedResponseException(
+                str.format(
+                    "No known sensors received from {0} at {1}",
+                    self.host, url
+                )
+            )
 
-                        if not at_least_one_enabled:
-                            raise ET.ParseError
+        # Calculate the derived sensors
 
-                    # Calculate the derived sensors
+        updated.append(derived_calc(today).idx)
 
-                    sen1 = self.sensors["OutputPower"]
-                    sen2 = self.sensors["Utilisation"]
-                    sen2.value = round((float(sen1.value) * 100 /
-                                        self.max_output), 2)
-                    sen2.date = date.today()
-                    sen2.enabled = True
-                    _LOGGER.debug("Set CALC sensor %s => %s",
-                                  sen2.name, sen2.value)
+        self._last_page[url] = (data, updated)
 
-                    return True
+    async def _poll(self, url, is_meter, derived_calc) -> bool:
+        """Fetch an XML page, update its sensors and the derived ones"""
+        if self._backing_off():
+            return False
 
-                except asyncio.TimeoutError:
-                    raise
+        try:
+            session = await self._get_session()
+
+            try:
+                async with self._get_semaphore():
+                    # A request queued ahead of this one may have failed
+                    # while this one waited
+                    if self._backing_off():
+                        return False
+                    timeout = self._request_timeout()
+                    async with session.get(url, timeout=timeout) as response:
+                        data = await response.read()
+
+                # The page is often byte-identical to the last poll,
+                # in which case only the dates need refreshing
+                today = date.today()
+                if not self._refresh_unchanged(url, data, today):
+                    self._parse_page(url, data, is_meter, today,
+                                     derived_calc)
+
+                self._record_success()
+                return True
+
+            except asyncio.TimeoutError:
+                self._record_failure()
+                raise
 
         except aiohttp.client_exceptions.ClientConnectorError as err:
+            self._record_failure()
             # Connection to inverter not possible.
             _LOGGER.warning(
                 "Connection failed. Check FQDN or IP address - %s",
@@ -389,75 +663,7 @@ class EnaSolar:
             raise UnexpectedResponseException(
                 str.format(
                     "No valid XML received from {0} at {1}",
-                    self.host, current_url
-                )
-            )
-
-    async def read_data(self) -> bool:
-        """Extract the data accummulators from their web page"""
-        try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(
-                timeout=timeout, raise_for_status=True
-            ) as session:
-                current_url = self.url + URL_PATH_DATA
-
-                try:
-                    async with session.get(current_url) as response:
-                        data = await response.text()
-                        at_least_one_enabled = False
-
-                        xml = ET.fromstring(data)
-
-                        for sen in self.sensors:
-                            if sen.is_meter:
-                                continue
-                            find = xml.find(sen.key)
-                            if find is not None:
-                                sen.value = find.text
-                                if sen.is_hex:
-                                    sen.value = int(sen.value, 16)
-                                sen.value = float(sen.value) * sen.factor
-                                sen.date = date.today()
-                                sen.enabled = True
-                                at_least_one_enabled = True
-
-                            if sen.enabled:
-                                _LOGGER.debug(
-                                    "Set DATA sensor %s => %s",
-                                    sen.name, sen.value
-                                )
-
-                        if not at_least_one_enabled:
-                            raise ET.ParseError
-
-                    # Calculate the derived sensors
-
-                    sen1 = self.sensors["EnergyLifetime"]
-                    sen2 = self.sensors["DaysProducing"]
-                    sen3 = self.sensors["AverageDailyPower"]
-                    sen3.value = round((float(sen1.value) / sen2.value), 2)
-                    sen3.date = date.today()
-                    sen3.enabled = True
-                    _LOGGER.debug("Set CALC sensor %s => %s",
-                                  sen3.name, sen3.value)
-                    return True
-
-                except asyncio.TimeoutError:
-                    raise
-
-        except aiohttp.client_exceptions.ClientConnectorError as err:
-            # Connection to inverter not possible.
-            _LOGGER.warning("Connection to inverter failed. %s",
-                            str(err))
-            raise
-
-        except ET.ParseError:
-            # XML is not valid or even no XML at all
-            raise UnexpectedResponseException(
-                str.format(
-                    "No valid XML received from {0} at {1}",
-                    self.host, current_url
+                    self.host, url
                 )
             )
 
@@ -477,8 +683,8 @@ async def main():
     inverter = EnaSolar()
     await inverter.interogate_inverter('192.168.1.143')
     inverter.setup_sensors()
-    await inverter.read_meters()
-    await inverter.read_data()
+    await inverter.read_all()
+    await inverter.close()
     logging.info('Finished')
 
 if __name__ == "__main__":